@@ -1,15 +1,17 @@
-import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { describe, it, expect, vi, beforeEach, afterEach } from 'vitest';
 import axios from 'axios';
 import { WhatsAppClient } from '../src/client';
 import { WhatsAppConfig, WhatsAppMessage } from '../src/types';
 
 vi.mock('axios', () => {
     const mockPost = vi.fn();
+    const mockGet = vi.fn();
     return {
         default: {
-            create: () => ({
-                post: mockPost
-            })
+            create: vi.fn(() => ({
+                post: mockPost,
+                get: mockGet
+            }))
         }
     };
 });
@@ -17,6 +19,7 @@ vi.mock('axios', () => {
 describe('WhatsAppClient', () => {
     let client;
     let mockPost;
+    let mockGet;
 
     const mockConfig = {
         accessToken: 'test-token',
@@ -29,6 +32,11 @@ describe('WhatsAppClient', () => {
         vi.clearAllMocks();
         client = new WhatsAppClient(mockConfig);
         mockPost = (axios.create()).post;
+        mockGet = (axios.create()).get;
+    });
+
+    afterEach(() => {
+        vi.useRealTimers();
     });
 
     describe('sendMessage', () => {
@@ -103,18 +111,235 @@ describe('WhatsAppClient', () => {
             mockPost.mockRejectedValue(mockError);
 
             await expect(client.sendMessage(mockMessage)).rejects.toThrow('API Error');
+            expect(mockPost).toHaveBeenCalledTimes(1);
+        });
+
+        it('should retry throttled requests honoring Retry-After', async () => {
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const throttled = { response: { status: 429, headers: { 'retry-after': '0' } } };
+            const mockResponse = { data: { message_id: 'test-id' } };
+            mockPost.mockRejectedValueOnce(throttled).mockResolvedValueOnce(mockResponse);
+
+            const response = await client.sendMessage(mockMessage);
+
+            expect(mockPost).toHaveBeenCalledTimes(2);
+            expect(response).toEqual(mockResponse);
+        });
+
+        it('should not retry client errors', async () => {
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const badRequest = { response: { status: 400, headers: {} } };
+            mockPost.mockRejectedValue(badRequest);
+
+            await expect(client.sendMessage(mockMessage)).rejects.toBe(badRequest);
+            expect(mockPost).toHaveBeenCalledTimes(1);
+        });
+
+        it('should not retry server errors by default', async () => {
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const serverError = { response: { status: 500, headers: {} } };
+            mockPost.mockRejectedValue(serverError);
+
+            await expect(client.sendMessage(mockMessage)).rejects.toBe(serverError);
+            expect(mockPost).toHaveBeenCalledTimes(1);
+        });
+
+        it('should back off before retrying server errors when opted in', async () => {
+            vi.useFakeTimers();
+            client = new WhatsAppClient({ ...mockConfig, retryServerErrors: true });
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const serverError = { response: { status: 502, headers: {} } };
+            const mockResponse = { data: { message_id: 'test-id' } };
+            mockPost.mockRejectedValueOnce(serverError).mockResolvedValueOnce(mockResponse);
+
+            const pending = client.sendMessage(mockMessage);
+
+            // First backoff is jittered between 0.5s and 1s
+            await vi.advanceTimersByTimeAsync(499);
+            expect(mockPost).toHaveBeenCalledTimes(1);
+
+            await vi.advanceTimersByTimeAsync(501);
+            expect(mockPost).toHaveBeenCalledTimes(2);
+            await expect(pending).resolves.toEqual(mockResponse);
+        });
+
+        it('should treat an empty Retry-After header as absent', async () => {
+            vi.useFakeTimers();
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const throttled = { response: { status: 429, headers: { 'retry-after': '' } } };
+            const mockResponse = { data: { message_id: 'test-id' } };
+            mockPost.mockRejectedValueOnce(throttled).mockResolvedValueOnce(mockResponse);
+
+            const pending = client.sendMessage(mockMessage);
+
+            await vi.advanceTimersByTimeAsync(0);
+            expect(mockPost).toHaveBeenCalledTimes(1);
+
+            await vi.advanceTimersByTimeAsync(1000);
+            expect(mockPost).toHaveBeenCalledTimes(2);
+            await expect(pending).resolves.toEqual(mockResponse);
+        });
+
+        it('should give up when Retry-After exceeds the maximum delay', async () => {
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const throttled = { response: { status: 429, headers: { 'retry-after': '120' } } };
+            mockPost.mockRejectedValue(throttled);
+
+            await expect(client.sendMessage(mockMessage)).rejects.toBe(throttled);
+            expect(mockPost).toHaveBeenCalledTimes(1);
+        });
+
+        it('should rethrow the last error after maxRetries attempts', async () => {
+            const maxRetries = 2;
+            client = new WhatsAppClient({ ...mockConfig, maxRetries });
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const throttled = (attempt) => ({
+                attempt,
+                response: { status: 429, headers: { 'retry-after': '0' } }
+            });
+            const lastError = throttled(3);
+            mockPost
+                .mockRejectedValueOnce(throttled(1))
+                .mockRejectedValueOnce(throttled(2))
+                .mockRejectedValueOnce(lastError);
+
+            await expect(client.sendMessage(mockMessage)).rejects.toBe(lastError);
+            expect(mockPost).toHaveBeenCalledTimes(maxRetries + 1);
+        });
+
+        it.each([NaN, Infinity, -1])('should fall back to 3 retries for maxRetries %s', async (maxRetries) => {
+            client = new WhatsAppClient({ ...mockConfig, maxRetries });
+            const mockMessage = {
+                type: 'text',
+                to: '1234567890',
+                content: 'Hello, World!'
+            };
+
+            const throttled = { response: { status: 429, headers: { 'retry-after': '0' } } };
+            mockPost.mockRejectedValue(throttled);
+
+            await expect(client.sendMessage(mockMessage)).rejects.toBe(throttled);
+            expect(mockPost).toHaveBeenCalledTimes(4);
+        });
+    });
+
+    describe('start', () => {
+        it('should emit ready without contacting the API by default', async () => {
+            const onReady = vi.fn();
+            client.on('ready', onReady);
+
+            await client.start();
+
+            expect(onReady).toHaveBeenCalledTimes(1);
+            expect(mockGet).not.toHaveBeenCalled();
+        });
+
+        it('should warm up the connection when opted in', async () => {
+            client = new WhatsAppClient({ ...mockConfig, warmUpConnection: true });
+            mockGet.mockResolvedValue({ data: { id: mockConfig.phoneNumberId } });
+
+            await client.start();
+
+            expect(mockGet).toHaveBeenCalledWith(`/${mockConfig.phoneNumberId}`, {
+                params: { fields: 'id' }
+            });
+        });
+
+        it('should ignore warm-up failures', async () => {
+            client = new WhatsAppClient({ ...mockConfig, warmUpConnection: true });
+            const onReady = vi.fn();
+            client.on('ready', onReady);
+            mockGet.mockRejectedValue({ response: { status: 403, headers: {} } });
+
+            await expect(client.start()).resolves.toBeUndefined();
+            expect(onReady).toHaveBeenCalledTimes(1);
         });
     });
 
     describe('verifyWebhook', () => {
-        it('should verify webhook token correctly', async () => {
-            const result = await client.verifyWebhook(mockConfig.webhookVerifyToken);
-            expect(result).toBe(true);
+        it.each([
+            ['accept the configured token', mockConfig.webhookVerifyToken, true],
+            ['reject an invalid token', 'invalid-token', false],
+        ])('should %s', async (_, token, expected) => {
+            const result = await client.verifyWebhook(token);
+            expect(result).toBe(expected);
         });
+    });
+
+    describe('connection pool', () => {
+        it('should pass the shared keep-alive agent to axios by default', () => {
+            const options = vi.mocked(axios.create).mock.calls[0][0];
+
+            expect(options.httpsAgent.keepAlive).toBe(true);
+            expect(options.httpsAgent.maxSockets).toBe(100);
+            expect(options.httpsAgent.maxFreeSockets).toBe(20);
+
+            new WhatsAppClient(mockConfig);
+            const nextOptions = vi.mocked(axios.create).mock.calls.at(-1)[0];
+            expect(nextOptions.httpsAgent).toBe(options.httpsAgent);
+        });
+
+        it('should use a dedicated agent for custom pool sizes', () => {
+            const sharedAgent = vi.mocked(axios.create).mock.calls[0][0].httpsAgent;
+
+            new WhatsAppClient({ ...mockConfig, maxSockets: 5, maxFreeSockets: 2 });
+            const options = vi.mocked(axios.create).mock.calls.at(-1)[0];
+
+            expect(options.httpsAgent).not.toBe(sharedAgent);
+            expect(options.httpsAgent.keepAlive).toBe(true);
+            expect(options.httpsAgent.maxSockets).toBe(5);
+            expect(options.httpsAgent.maxFreeSockets).toBe(2);
+        });
+
+        it('should destroy only a dedicated agent on stop', async () => {
+            const sharedAgent = vi.mocked(axios.create).mock.calls[0][0].httpsAgent;
+            const destroyShared = vi.spyOn(sharedAgent, 'destroy');
+
+            const dedicatedClient = new WhatsAppClient({ ...mockConfig, maxSockets: 5 });
+            const dedicatedAgent = vi.mocked(axios.create).mock.calls.at(-1)[0].httpsAgent;
+            const destroyDedicated = vi.spyOn(dedicatedAgent, 'destroy');
+
+            await client.stop();
+            await dedicatedClient.stop();
 
-        it('should reject invalid webhook token', async () => {
-            const result = await client.verifyWebhook('invalid-token');
-            expect(result).toBe(false);
+            expect(destroyShared).not.toHaveBeenCalled();
+            expect(destroyDedicated).toHaveBeenCalledTimes(1);
+            destroyShared.mockRestore();
         });
     });
 });
@@ -7,6 +7,12 @@ describe('MessageHandler', () => {
     let messageHandler;
     let mockClient;
 
+    const mockMessage = {
+        type: 'text',
+        to: '1234567890',
+        content: 'Test message'
+    };
+
     beforeEach(() => {
         mockClient = {
             sendMessage: vi.fn(),
@@ -16,12 +22,6 @@ describe('MessageHandler', () => {
     });
 
     it('should successfully send a message', async () => {
-        const mockMessage = {
-            type: 'text',
-            to: '1234567890',
-            content: 'Test message'
-        };
-
         const mockResponse = {
             messaging_product: 'whatsapp',
             contacts: [{ input: '1234567890', wa_id: 'WHATSAPP_ID' }],
@@ -37,12 +37,6 @@ describe('MessageHandler', () => {
     });
 
     it('should handle client errors with error message', async () => {
-        const mockMessage = {
-            type: 'text',
-            to: '1234567890',
-            content: 'Test message'
-        };
-
         const errorMessage = 'API Error';
         (mockClient.sendMessage).mockRejectedValue(new Error(errorMessage));
 
@@ -52,16 +46,55 @@ describe('MessageHandler', () => {
     });
 
     it('should handle unknown errors', async () => {
-        const mockMessage = {
-            type: 'text',
-            to: '1234567890',
-            content: 'Test message'
-        };
-
         (mockClient.sendMessage).mockRejectedValue('Unknown error');
 
         await expect(messageHandler.send(mockMessage))
             .rejects
             .toThrow('Failed to send WhatsApp message');
     });
+
+    it('should send many messages with bounded concurrency', async () => {
+        const messages = ['111', '222', '333', '444'].map((to) => ({
+            type: 'text',
+            to,
+            content: 'Broadcast'
+        }));
+
+        let inFlight = 0;
+        let maxInFlight = 0;
+        (mockClient.sendMessage).mockImplementation(async (message) => {
+            inFlight++;
+            maxInFlight = Math.max(maxInFlight, inFlight);
+            await new Promise((resolve) => setTimeout(resolve, 0));
+            inFlight--;
+            if (message.to === '333') {
+                throw new Error('API Error');
+            }
+            return { data: { messages: [{ id: `id-${message.to}` }] } };
+        });
+
+        const results = await messageHandler.sendMany(messages, 2);
+
+        expect(mockClient.sendMessage).toHaveBeenCalledTimes(4);
+        expect(maxInFlight).toBe(2);
+        expect(results.map((r) => r.status)).toEqual(['fulfilled', 'fulfilled', 'rejected', 'fulfilled']);
+        expect(results[0].value).toEqual({ messages: [{ id: 'id-111' }] });
+        expect(results[2].reason.message).toBe('Failed to send WhatsApp message: API Error');
+    });
+
+    it.each([NaN, 0, -1, Infinity])('should fall back to the default concurrency for %s', async (concurrency) => {
+        const messages = ['111', '222', '333'].map((to) => ({
+            type: 'text',
+            to,
+            content: 'Broadcast'
+        }));
+        (mockClient.sendMessage).mockImplementation(async (message) => ({ data: { to: message.to } }));
+
+        const results = await messageHandler.sendMany(messages, concurrency);
+
+        expect(mockClient.sendMessage).toHaveBeenCalledTimes(3);
+        expect(results).toHaveLength(3);
+        expect(results.every((r) => r.status === 'fulfilled')).toBe(true);
+        expect(results.map((r) => r.value)).toEqual([{ to: '111' }, { to: '222' }, { to: '333' }]);
+    });
 });
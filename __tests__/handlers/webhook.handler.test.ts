@@ -122,6 +122,134 @@ describe('WebhookHandler', () => {
         expect(consoleSpy).toHaveBeenCalledWith('Received status update:', mockStatus);
     });
 
+    it('should process every entry and change in a batched event', async () => {
+        const firstMessage = {
+            from: '1234567890',
+            id: 'msg_1',
+            timestamp: '1234567890',
+            text: {
+                body: 'First'
+            }
+        };
+
+        const secondMessage = {
+            from: '0987654321',
+            id: 'msg_2',
+            timestamp: '1234567891',
+            text: {
+                body: 'Second'
+            }
+        };
+
+        const metadata = {
+            display_phone_number: '1234567890',
+            phone_number_id: 'PHONE_ID'
+        };
+
+        const mockEvent = {
+            object: 'whatsapp_business_account',
+            entry: [{
+                id: 'BUSINESS_ID',
+                changes: [{
+                    value: {
+                        messaging_product: 'whatsapp',
+                        metadata,
+                        messages: [firstMessage]
+                    }
+                }]
+            }, {
+                id: 'BUSINESS_ID',
+                changes: [{
+                    value: {
+                        messaging_product: 'whatsapp',
+                        metadata,
+                        messages: [secondMessage]
+                    }
+                }]
+            }]
+        };
+
+        await webhookHandler.handle(mockEvent);
+
+        expect(consoleSpy).toHaveBeenCalledWith('Received message:', firstMessage);
+        expect(consoleSpy).toHaveBeenCalledWith('Received message:', secondMessage);
+    });
+
+    it('should keep per-sender order while handling senders concurrently', async () => {
+        const events = [];
+        const delays = { a1: 20, a2: 0, b1: 0 };
+        vi.spyOn(webhookHandler, 'handleMessage').mockImplementation(async (message) => {
+            events.push(`start:${message.id}`);
+            await new Promise((resolve) => setTimeout(resolve, delays[message.id]));
+            events.push(`end:${message.id}`);
+        });
+
+        const mockEvent = {
+            object: 'whatsapp_business_account',
+            entry: [{
+                id: 'BUSINESS_ID',
+                changes: [{
+                    value: {
+                        messaging_product: 'whatsapp',
+                        metadata: {
+                            display_phone_number: '1234567890',
+                            phone_number_id: 'PHONE_ID'
+                        },
+                        messages: [
+                            { from: 'A', id: 'a1', timestamp: '1', text: { body: 'first' } },
+                            { from: 'A', id: 'a2', timestamp: '2', text: { body: 'second' } },
+                            { from: 'B', id: 'b1', timestamp: '3', text: { body: 'other' } }
+                        ]
+                    }
+                }]
+            }]
+        };
+
+        await webhookHandler.handle(mockEvent);
+
+        // A's second message starts only after its first finished
+        expect(events.indexOf('start:a2')).toBeGreaterThan(events.indexOf('end:a1'));
+        // B did not wait behind A's slow message
+        expect(events.indexOf('end:b1')).toBeLessThan(events.indexOf('end:a1'));
+    });
+
+    it('should finish every handler before rethrowing the first failure', async () => {
+        const finished = [];
+        vi.spyOn(webhookHandler, 'handleMessage').mockImplementation(async (message) => {
+            if (message.id === 'a1') {
+                throw new Error('handler failed');
+            }
+            await new Promise((resolve) => setTimeout(resolve, 10));
+            finished.push(message.id);
+        });
+
+        const mockEvent = {
+            object: 'whatsapp_business_account',
+            entry: [{
+                id: 'BUSINESS_ID',
+                changes: [{
+                    value: {
+                        messaging_product: 'whatsapp',
+                        metadata: {
+                            display_phone_number: '1234567890',
+                            phone_number_id: 'PHONE_ID'
+                        },
+                        messages: [
+                            { from: 'A', id: 'a1', timestamp: '1', text: { body: 'first' } },
+                            { from: 'A', id: 'a2', timestamp: '2', text: { body: 'second' } },
+                            { from: 'B', id: 'b1', timestamp: '3', text: { body: 'other' } }
+                        ]
+                    }
+                }]
+            }]
+        };
+
+        await expect(webhookHandler.handle(mockEvent))
+            .rejects
+            .toThrow('Failed to send WhatsApp message: handler failed');
+        expect(finished.sort()).toEqual(['a2', 'b1']);
+    });
+
     it('should handle errors correctly', async () => {
         const mockEvent = {};
 
@@ -0,0 +1,76 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { EventEmitter } from 'events';
+import { ClientFactory } from '../src/clients/factory';
+import { WhatsAppPlugin } from '../src/index';
+
+vi.mock('../src/clients/factory', () => ({
+    ClientFactory: {
+        create: vi.fn()
+    }
+}));
+
+describe('WhatsAppPlugin', () => {
+    let plugin;
+    let mockClient;
+
+    const mockConfig = {
+        accessToken: 'test-token',
+        phoneNumberId: 'test-phone-id'
+    };
+
+    const textMessage = (to) => ({
+        type: 'text',
+        to,
+        content: 'Hello'
+    });
+
+    beforeEach(() => {
+        mockClient = Object.assign(new EventEmitter(), {
+            start: vi.fn(),
+            stop: vi.fn(),
+            sendMessage: vi.fn(),
+            getConnectionStatus: vi.fn(() => 'open')
+        });
+        vi.mocked(ClientFactory.create).mockReturnValue(mockClient);
+
+        plugin = new WhatsAppPlugin(mockConfig);
+    });
+
+    describe('sendMessages', () => {
+        it('should settle every message in input order', async () => {
+            mockClient.sendMessage.mockImplementation(async (message) => {
+                if (message.to === '2') {
+                    throw new Error('API Error');
+                }
+                return { data: { to: message.to } };
+            });
+
+            const results = await plugin.sendMessages(['1', '2', '3'].map(textMessage));
+
+            expect(results).toEqual([
+                { status: 'fulfilled', value: { to: '1' } },
+                { status: 'rejected', reason: new Error('Failed to send WhatsApp message: API Error') },
+                { status: 'fulfilled', value: { to: '3' } }
+            ]);
+        });
+
+        it('should send at most 10 messages at once by default', async () => {
+            let inFlight = 0;
+            let maxInFlight = 0;
+            mockClient.sendMessage.mockImplementation(async () => {
+                inFlight++;
+                maxInFlight = Math.max(maxInFlight, inFlight);
+                await new Promise((resolve) => setTimeout(resolve, 0));
+                inFlight--;
+                return { data: {} };
+            });
+
+            const messages = Array.from({ length: 25 }, (_, i) => textMessage(String(i)));
+            const results = await plugin.sendMessages(messages);
+
+            expect(results).toHaveLength(25);
+            expect(mockClient.sendMessage).toHaveBeenCalledTimes(25);
+            expect(maxInFlight).toBe(10);
+        });
+    });
+});
@@ -0,0 +1,227 @@
+import { describe, it, expect, vi, beforeEach } from 'vitest';
+import { EventEmitter } from 'events';
+import { logger } from '@elizaos/core';
+
+vi.mock('@elizaos/core', () => ({
+    Service: class {
+        runtime;
+        constructor(runtime) {
+            this.runtime = runtime;
+        }
+    },
+    stringToUuid: (value) => `uuid-${value}`,
+    ChannelType: { DM: 'DM' },
+    EventType: { MESSAGE_RECEIVED: 'MESSAGE_RECEIVED' },
+    logger: { info: vi.fn(), warn: vi.fn(), error: vi.fn() },
+}));
+
+vi.mock('../src/index', () => ({
+    WhatsAppPlugin: vi.fn(),
+}));
+
+import { WhatsAppPlugin } from '../src/index';
+import { WhatsAppConnectorService } from '../src/service';
+
+describe('WhatsAppConnectorService', () => {
+    let service;
+    let mockRuntime;
+
+    const textMessage = (id, from = '1234567890') => ({
+        id,
+        from,
+        timestamp: 1700000000,
+        type: 'text',
+        content: 'Hello',
+    });
+
+    beforeEach(() => {
+        vi.clearAllMocks();
+        mockRuntime = {
+            agentId: 'agent-1',
+            getSetting: vi.fn(() => null),
+            ensureWorldExists: vi.fn().mockResolvedValue(undefined),
+            ensureConnection: vi.fn().mockResolvedValue(undefined),
+            createMemory: vi.fn().mockResolvedValue(undefined),
+            emitEvent: vi.fn().mockResolvedValue(undefined),
+            registerSendHandler: vi.fn(),
+        };
+
+        service = new WhatsAppConnectorService(mockRuntime);
+    });
+
+    describe('resolveConfig', () => {
+        const settings = (values) => (key) => values[key] ?? null;
+
+        it('should enable the Cloud API warm-up from settings', () => {
+            mockRuntime.getSetting.mockImplementation(settings({
+                WHATSAPP_ACCESS_TOKEN: 'test-token',
+                WHATSAPP_PHONE_NUMBER_ID: 'test-phone-id',
+                WHATSAPP_WARM_UP_CONNECTION: 'true',
+            }));
+
+            expect(service['resolveConfig']()).toEqual(
+                expect.objectContaining({ accessToken: 'test-token', warmUpConnection: true })
+            );
+        });
+
+        it('should leave the Cloud API warm-up off by default', () => {
+            mockRuntime.getSetting.mockImplementation(settings({
+                WHATSAPP_ACCESS_TOKEN: 'test-token',
+                WHATSAPP_PHONE_NUMBER_ID: 'test-phone-id',
+            }));
+
+            expect(service['resolveConfig']()).toEqual(
+                expect.objectContaining({ warmUpConnection: false })
+            );
+        });
+    });
+
+    describe('world setup', () => {
+        it('should ensure the world once across messages', async () => {
+            await service['handleIncomingMessage'](textMessage('m1', 'A'));
+            await service['handleIncomingMessage'](textMessage('m2', 'B'));
+
+            expect(mockRuntime.ensureWorldExists).toHaveBeenCalledTimes(1);
+            expect(mockRuntime.ensureWorldExists).toHaveBeenCalledWith(
+                expect.objectContaining({ id: 'uuid-whatsapp-world-agent-1', agentId: 'agent-1' })
+            );
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledWith(
+                expect.objectContaining({ worldId: 'uuid-whatsapp-world-agent-1' })
+            );
+        });
+
+        it('should retry after ensureWorldExists rejects', async () => {
+            mockRuntime.ensureWorldExists.mockRejectedValueOnce(new Error('db down'));
+
+            await expect(service['handleIncomingMessage'](textMessage('m1')))
+                .rejects
+                .toThrow('db down');
+            await service['handleIncomingMessage'](textMessage('m2'));
+
+            expect(mockRuntime.ensureWorldExists).toHaveBeenCalledTimes(2);
+            expect(mockRuntime.createMemory).toHaveBeenCalledTimes(1);
+        });
+
+        it('should ensure the world again once the cache period expires', async () => {
+            const nowSpy = vi.spyOn(Date, 'now').mockReturnValue(0);
+            try {
+                await service['handleIncomingMessage'](textMessage('m1', 'A'));
+                nowSpy.mockReturnValue(5 * 60 * 1000);
+                await service['handleIncomingMessage'](textMessage('m2', 'B'));
+                expect(mockRuntime.ensureWorldExists).toHaveBeenCalledTimes(1);
+
+                nowSpy.mockReturnValue(11 * 60 * 1000);
+                await service['handleIncomingMessage'](textMessage('m3', 'C'));
+                expect(mockRuntime.ensureWorldExists).toHaveBeenCalledTimes(2);
+            } finally {
+                nowSpy.mockRestore();
+            }
+        });
+
+        it('should ensure the world again after stop()', async () => {
+            await service['handleIncomingMessage'](textMessage('m1'));
+            await service.stop();
+            await service['handleIncomingMessage'](textMessage('m2'));
+
+            expect(mockRuntime.ensureWorldExists).toHaveBeenCalledTimes(2);
+        });
+    });
+
+    describe('sender setup', () => {
+        it('should ensure the connection once per sender', async () => {
+            await service['handleIncomingMessage'](textMessage('m1'));
+            await service['handleIncomingMessage'](textMessage('m2'));
+
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(1);
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledWith(
+                expect.objectContaining({
+                    entityId: 'uuid-whatsapp-entity-1234567890',
+                    roomId: 'uuid-whatsapp-room-1234567890-agent-1',
+                    channelId: '1234567890',
+                })
+            );
+            expect(mockRuntime.createMemory).toHaveBeenCalledTimes(2);
+        });
+
+        it('should retry after ensureConnection rejects', async () => {
+            mockRuntime.ensureConnection.mockRejectedValueOnce(new Error('db down'));
+
+            await expect(service['handleIncomingMessage'](textMessage('m1')))
+                .rejects
+                .toThrow('db down');
+            await service['handleIncomingMessage'](textMessage('m2'));
+
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(2);
+            expect(mockRuntime.createMemory).toHaveBeenCalledTimes(1);
+        });
+
+        it('should ensure the connection again once the cache entry expires', async () => {
+            const nowSpy = vi.spyOn(Date, 'now').mockReturnValue(0);
+            try {
+                await service['handleIncomingMessage'](textMessage('m1'));
+                nowSpy.mockReturnValue(5 * 60 * 1000);
+                await service['handleIncomingMessage'](textMessage('m2'));
+                expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(1);
+
+                nowSpy.mockReturnValue(11 * 60 * 1000);
+                await service['handleIncomingMessage'](textMessage('m3'));
+                expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(2);
+            } finally {
+                nowSpy.mockRestore();
+            }
+        });
+
+        it('should evict the least recently seen sender past the cache limit', async () => {
+            for (let i = 0; i <= 1000; i++) {
+                await service['handleIncomingMessage'](textMessage(`m${i}`, `sender-${i}`));
+            }
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(1001);
+
+            // sender-0 was evicted; sender-1000 is still cached
+            await service['handleIncomingMessage'](textMessage('again-1000', 'sender-1000'));
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(1001);
+            await service['handleIncomingMessage'](textMessage('again-0', 'sender-0'));
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(1002);
+        });
+
+        it('should ensure the connection again after stop()', async () => {
+            await service['handleIncomingMessage'](textMessage('m1'));
+            await service.stop();
+            await service['handleIncomingMessage'](textMessage('m2'));
+
+            expect(mockRuntime.ensureConnection).toHaveBeenCalledTimes(2);
+        });
+    });
+
+    describe('incoming message listener', () => {
+        it('should log a failed message instead of leaving the rejection unhandled', async () => {
+            const plugin = Object.assign(new EventEmitter(), {
+                start: vi.fn().mockResolvedValue(undefined),
+            });
+            vi.mocked(WhatsAppPlugin).mockImplementation(function () {
+                return plugin;
+            });
+            mockRuntime.getSetting.mockImplementation((key) =>
+                key === 'WHATSAPP_AUTH_DIR' ? './whatsapp-auth' : null
+            );
+            mockRuntime.createMemory.mockRejectedValue(new Error('db down'));
+
+            const unhandled = vi.fn();
+            process.on('unhandledRejection', unhandled);
+            try {
+                await service['initialize']();
+                plugin.emit('message', textMessage('m1'));
+
+                await vi.waitFor(() => {
+                    expect(logger.error).toHaveBeenCalledWith(
+                        '[WhatsApp] Failed to handle incoming message:',
+                        'db down'
+                    );
+                });
+                expect(unhandled).not.toHaveBeenCalled();
+            } finally {
+                process.off('unhandledRejection', unhandled);
+            }
+        });
+    });
+});
@@ -5,6 +5,9 @@ import { EventEmitter } from 'events';
 import type { BaileysAuthManager } from './auth';
 import type { ConnectionStatus } from '../types';
 
+// Shared across connects and reconnects instead of building a new logger each time
+const silentLogger = pino({ level: 'silent' });
+
 export class BaileysConnection extends EventEmitter {
   private socket?: WASocket;
   private authManager: BaileysAuthManager;
@@ -31,7 +34,7 @@ export class BaileysConnection extends EventEmitter {
     this.socket = makeWASocket({
       auth: state,
       printQRInTerminal: false,
-      logger: pino({ level: 'silent' }),
+      logger: silentLogger,
       browser: ['Chrome (Linux)', '', ''],
     });
 
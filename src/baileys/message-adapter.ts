@@ -1,40 +1,42 @@
 import type { proto } from '@whiskeysockets/baileys';
 import type { UnifiedMessage, WhatsAppMessage } from '../types';
+import { isTextMessage } from '../utils/validators';
 
 export class MessageAdapter {
   // Convert Baileys message to unified format
   toUnified(msg: proto.IWebMessageInfo): UnifiedMessage {
+    const { type, content } = this.classify(msg.message);
     return {
       id: msg.key?.id ?? '',
       from: msg.key?.remoteJid ?? '',
       timestamp: Number(msg.messageTimestamp ?? 0),
-      type: this.detectType(msg),
-      content: this.extractContent(msg)
+      type,
+      content
     };
   }
 
   // Convert unified message to Baileys format
   toBaileys(msg: WhatsAppMessage) {
-    if (msg.type === 'text') {
-      return { text: msg.content as string };
+    if (isTextMessage(msg)) {
+      return { text: msg.content };
     }
     // Add more types as needed
     throw new Error(`Message type ${msg.type} not yet supported for Baileys`);
   }
 
-  private detectType(msg: proto.IWebMessageInfo): 'text' | 'image' | 'audio' | 'video' | 'document' {
-    if (msg.message?.conversation) return 'text';
-    if (msg.message?.extendedTextMessage) return 'text';
-    if (msg.message?.imageMessage) return 'image';
-    if (msg.message?.audioMessage) return 'audio';
-    if (msg.message?.videoMessage) return 'video';
-    if (msg.message?.documentMessage) return 'document';
-    return 'text';
-  }
-
-  private extractContent(msg: proto.IWebMessageInfo): string {
-    return msg.message?.conversation ||
-           msg.message?.extendedTextMessage?.text ||
-           '';
+  // Detect the type and extract the text content in a single pass
+  private classify(
+    message: proto.IMessage | null | undefined
+  ): Pick<UnifiedMessage, 'type' | 'content'> {
+    if (!message) return { type: 'text', content: '' };
+    if (message.conversation) return { type: 'text', content: message.conversation };
+    if (message.extendedTextMessage) {
+      return { type: 'text', content: message.extendedTextMessage.text || '' };
+    }
+    if (message.imageMessage) return { type: 'image', content: '' };
+    if (message.audioMessage) return { type: 'audio', content: '' };
+    if (message.videoMessage) return { type: 'video', content: '' };
+    if (message.documentMessage) return { type: 'document', content: '' };
+    return { type: 'text', content: '' };
   }
 }
@@ -1,19 +1,68 @@
-import axios, { type AxiosInstance } from "axios";
+import axios, { type AxiosError, type AxiosInstance } from "axios";
 import { EventEmitter } from "events";
+import { Agent } from "https";
 import type { IWhatsAppClient } from "./interface";
 import type { CloudAPIConfig, WhatsAppMessage, ConnectionStatus } from "../types";
 
+const DEFAULT_MAX_RETRIES = 3;
+const MAX_RETRY_DELAY_MS = 30000;
+const DEFAULT_MAX_SOCKETS = 100;
+const DEFAULT_MAX_FREE_SOCKETS = 20;
+
+// Shared by every client using the default pool sizes so sends reuse warm TLS
+// connections to graph.facebook.com
+const sharedGraphApiAgent = new Agent({
+    keepAlive: true,
+    maxSockets: DEFAULT_MAX_SOCKETS,
+    maxFreeSockets: DEFAULT_MAX_FREE_SOCKETS,
+});
+
+function getGraphApiAgent(config: CloudAPIConfig): Agent {
+    if (config.maxSockets === undefined && config.maxFreeSockets === undefined) {
+        return sharedGraphApiAgent;
+    }
+    // Custom pool sizes get a dedicated agent so they don't affect other clients
+    return new Agent({
+        keepAlive: true,
+        maxSockets: config.maxSockets ?? DEFAULT_MAX_SOCKETS,
+        maxFreeSockets: config.maxFreeSockets ?? DEFAULT_MAX_FREE_SOCKETS,
+    });
+}
+
+// Parse a Retry-After header (delay in seconds or an HTTP date) into milliseconds
+function parseRetryAfter(header: unknown): number | null {
+    const value = typeof header === "number" ? String(header) : header;
+    if (typeof value !== "string" || value.trim() === "") {
+        return null;
+    }
+
+    const seconds = Number(value);
+    if (Number.isFinite(seconds)) {
+        return seconds >= 0 ? seconds * 1000 : null;
+    }
+
+    const date = Date.parse(value);
+    return Number.isNaN(date) ? null : Math.max(0, date - Date.now());
+}
+
 export class CloudAPIClient extends EventEmitter implements IWhatsAppClient {
     private client: AxiosInstance;
     private config: CloudAPIConfig;
+    private messagesEndpoint: string;
+    // Set only when this client owns its agent; the shared one outlives any client
+    private dedicatedAgent: Agent | null;
 
     constructor(config: CloudAPIConfig) {
         super();
         this.config = config;
+        this.messagesEndpoint = `/${config.phoneNumberId}/messages`;
         // Default to v24.0 (current version). Supported range: v19.0 - v24.0
         const apiVersion = config.apiVersion || 'v24.0';
+        const httpsAgent = getGraphApiAgent(config);
+        this.dedicatedAgent = httpsAgent === sharedGraphApiAgent ? null : httpsAgent;
         this.client = axios.create({
             baseURL: `https://graph.facebook.com/${apiVersion}`,
+            httpsAgent,
             headers: {
                 Authorization: `Bearer ${config.accessToken}`,
                 "Content-Type": "application/json",
@@ -22,29 +71,84 @@ export class CloudAPIClient extends EventEmitter implements IWhatsAppClient {
     }
 
     async start(): Promise<void> {
-        // Cloud API doesn't need initialization
+        // Cloud API doesn't need initialization. When opted in, prime the keep-alive
+        // pool so the first send doesn't pay the TLS handshake. Best-effort: a failure
+        // here will surface on the first real send instead
+        if (this.config.warmUpConnection) {
+            this.client
+                .get(`/${this.config.phoneNumberId}`, { params: { fields: "id" } })
+                .catch(() => undefined);
+        }
+
         // Emit ready immediately
         this.emit('ready');
     }
 
     async stop(): Promise<void> {
-        // Cloud API doesn't need cleanup
+        // Close idle keep-alive sockets of a dedicated pool. The agent stays usable,
+        // so a later start() simply opens new connections
+        this.dedicatedAgent?.destroy();
     }
 
     async sendMessage(message: WhatsAppMessage): Promise<any> {
-        const endpoint = `/${this.config.phoneNumberId}/messages`;
-
-        const payload = {
+        const payload: Record<string, unknown> = {
             messaging_product: "whatsapp",
             recipient_type: "individual",
             to: message.to,
             type: message.type,
-            ...(message.type === "text"
-                ? { text: { body: message.content } }
-                : { template: message.content }),
         };
+        if (message.type === "text") {
+            payload.text = { body: message.content };
+        } else {
+            payload.template = message.content;
+        }
+
+        return this.postWithRetry(this.messagesEndpoint, payload);
+    }
+
+    private async postWithRetry(endpoint: string, payload: unknown): Promise<any> {
+        // A non-finite or negative value would retry a sustained 429 forever
+        const configured = this.config.maxRetries;
+        const maxRetries =
+            Number.isFinite(configured) && configured >= 0
+                ? Math.floor(configured)
+                : DEFAULT_MAX_RETRIES;
+        for (let attempt = 0; ; attempt++) {
+            try {
+                return await this.client.post(endpoint, payload);
+            } catch (error) {
+                const delay = this.getRetryDelay(error as AxiosError, attempt);
+                if (delay === null || attempt >= maxRetries) {
+                    throw error;
+                }
+                await new Promise((resolve) => setTimeout(resolve, delay));
+            }
+        }
+    }
+
+    // Sends are not idempotent: a 5xx can arrive after Graph already accepted the
+    // message, so by default only throttling (429, or 503 with Retry-After) is retried
+    private getRetryDelay(error: AxiosError, attempt: number): number | null {
+        const response = error?.response;
+        const status = response?.status;
+        const retryAfter = parseRetryAfter(response?.headers?.["retry-after"]);
+
+        const retryable =
+            status === 429 ||
+            (status === 503 && retryAfter !== null) ||
+            (this.config.retryServerErrors === true && status >= 500);
+        if (!retryable) {
+            return null;
+        }
+
+        if (retryAfter !== null) {
+            // Never retry before the server allows it; give up if that is too far out
+            return retryAfter <= MAX_RETRY_DELAY_MS ? retryAfter : null;
+        }
 
-        return this.client.post(endpoint, payload);
+        // Exponential backoff with jitter: 0.5-1s, 1-2s, 2-4s, etc., capped at 30s
+        const backoff = Math.min(1000 * Math.pow(2, attempt), MAX_RETRY_DELAY_MS);
+        return backoff / 2 + Math.random() * (backoff / 2);
     }
 
     async verifyWebhook(token: string): Promise<boolean> {
@@ -1,6 +1,8 @@
 import type { IWhatsAppClient } from "../clients/interface";
 import type { WhatsAppMessage } from "../types";
 
+const DEFAULT_SEND_CONCURRENCY = 10;
+
 export class MessageHandler {
     constructor(private client: IWhatsAppClient) {}
 
@@ -18,4 +20,35 @@ export class MessageHandler {
             throw new Error("Failed to send WhatsApp message");
         }
     }
+
+    async sendMany(
+        messages: WhatsAppMessage[],
+        concurrency = DEFAULT_SEND_CONCURRENCY
+    ): Promise<PromiseSettledResult<unknown>[]> {
+        // Results keep input order; one failed send does not abort the rest
+        const results: PromiseSettledResult<unknown>[] = new Array(messages.length);
+        let next = 0;
+
+        const worker = async (): Promise<void> => {
+            while (next < messages.length) {
+                const index = next++;
+                try {
+                    results[index] = {
+                        status: "fulfilled",
+                        value: await this.send(messages[index]),
+                    };
+                } catch (reason) {
+                    results[index] = { status: "rejected", reason };
+                }
+            }
+        };
+
+        const limit =
+            Number.isFinite(concurrency) && concurrency >= 1
+                ? Math.floor(concurrency)
+                : DEFAULT_SEND_CONCURRENCY;
+        const workers = Math.max(1, Math.min(limit, messages.length));
+        await Promise.all(Array.from({ length: workers }, worker));
+        return results;
+    }
 }
@@ -6,21 +6,53 @@ export class WebhookHandler {
 
     async handle(event: WhatsAppWebhookEvent): Promise<void> {
         try {
-            // Process messages
-            if (event.entry?.[0]?.changes?.[0]?.value?.messages) {
-                const messages = event.entry[0].changes[0].value.messages;
-                for (const message of messages) {
-                    await this.handleMessage(message);
+            // Meta may batch several entries and changes into one delivery. Work for
+            // the same contact runs in delivery order; different contacts run concurrently
+            const queues = new Map<string, Array<() => Promise<void>>>();
+            const enqueue = (contact: string, task: () => Promise<void>) => {
+                const queue = queues.get(contact);
+                if (queue) {
+                    queue.push(task);
+                } else {
+                    queues.set(contact, [task]);
                 }
-            }
+            };
+
+            for (const entry of event.entry ?? []) {
+                for (const change of entry.changes ?? []) {
+                    const value = change.value;
+                    if (!value) {
+                        continue;
+                    }
+
+                    // Process messages
+                    const messages = value.messages;
+                    if (messages) {
+                        for (const message of messages) {
+                            enqueue(message.from, () => this.handleMessage(message));
+                        }
+                    }
 
-            // Process status updates
-            if (event.entry?.[0]?.changes?.[0]?.value?.statuses) {
-                const statuses = event.entry[0].changes[0].value.statuses;
-                for (const status of statuses) {
-                    await this.handleStatus(status);
+                    // Process status updates
+                    const statuses = value.statuses;
+                    if (statuses) {
+                        for (const status of statuses) {
+                            enqueue(status.recipient_id, () => this.handleStatus(status));
+                        }
+                    }
                 }
             }
+
+            // Let every handler finish before surfacing the first failure
+            const results = await Promise.allSettled(
+                Array.from(queues.values(), (tasks) => this.runInOrder(tasks))
+            );
+            const failure = results.find(
+                (result): result is PromiseRejectedResult => result.status === "rejected"
+            );
+            if (failure) {
+                throw failure.reason;
+            }
         } catch (error: unknown) {
             if (error instanceof Error) {
                 throw new Error(
@@ -31,6 +63,25 @@ export class WebhookHandler {
         }
     }
 
+    // Runs every task in sequence, then rethrows the first failure (if any)
+    private async runInOrder(tasks: Array<() => Promise<void>>): Promise<void> {
+        let failed = false;
+        let firstError: unknown;
+        for (const task of tasks) {
+            try {
+                await task();
+            } catch (error) {
+                if (!failed) {
+                    failed = true;
+                    firstError = error;
+                }
+            }
+        }
+        if (failed) {
+            throw firstError;
+        }
+    }
+
     private async handleMessage(message: any): Promise<void> {
         // Implement message handling logic
         // This could emit events or trigger callbacks based on your framework's needs
@@ -43,6 +43,13 @@ export class WhatsAppPlugin extends EventEmitter implements Plugin {
         return this.messageHandler.send(message);
     }
 
+    async sendMessages(
+        messages: WhatsAppMessage[],
+        concurrency?: number
+    ): Promise<PromiseSettledResult<unknown>[]> {
+        return this.messageHandler.sendMany(messages, concurrency);
+    }
+
     async handleWebhook(event: WhatsAppWebhookEvent): Promise<void> {
         return this.webhookHandler.handle(event);
     }
@@ -3,6 +3,7 @@ import {
   type Memory,
   type Content,
   type TargetInfo,
+  type UUID,
   Service,
   EventType,
   ChannelType,
@@ -13,6 +14,13 @@ import { WhatsAppPlugin } from "./index";
 import type { WhatsAppConfig, UnifiedMessage } from "./types";
 
 const SOURCE = "whatsapp";
+// Re-run ensureWorldExists/ensureConnection periodically so a removed world,
+// entity, or room is recreated instead of being assumed forever
+const ENSURE_CACHE_TTL_MS = 10 * 60 * 1000;
+// Least recently seen senders are evicted past this many entries
+const SENDER_CACHE_MAX = 1000;
+
+type SenderIds = { entityId: UUID; roomId: UUID };
 
 /** Read a setting from runtime (character settings) with fallback to process.env */
 function getSetting(runtime: IAgentRuntime, key: string): string | null {
@@ -28,6 +36,9 @@ export class WhatsAppConnectorService extends Service {
     "Connects the agent to WhatsApp using Baileys (QR code) or Cloud API";
 
   private plugin: WhatsAppPlugin | null = null;
+  private worldReady: Promise<UUID> | null = null;
+  private worldExpiresAt = 0;
+  private senders = new Map<string, { expiresAt: number; pending: Promise<SenderIds> }>();
 
   static async start(
     runtime: IAgentRuntime
@@ -38,6 +49,8 @@ export class WhatsAppConnectorService extends Service {
   }
 
   async stop(): Promise<void> {
+    this.worldReady = null;
+    this.senders.clear();
     if (this.plugin) {
       await this.plugin.stop();
       this.plugin = null;
@@ -64,6 +77,7 @@ export class WhatsAppConnectorService extends Service {
         webhookVerifyToken: getSetting(runtime, "WHATSAPP_WEBHOOK_VERIFY_TOKEN") ?? undefined,
         businessAccountId: getSetting(runtime, "WHATSAPP_BUSINESS_ID") ?? undefined,
         apiVersion: getSetting(runtime, "WHATSAPP_API_VERSION") ?? undefined,
+        warmUpConnection: getSetting(runtime, "WHATSAPP_WARM_UP_CONNECTION") === "true",
       };
     }
 
@@ -100,8 +114,15 @@ export class WhatsAppConnectorService extends Service {
       logger.error("[WhatsApp] Error:", err.message);
     });
 
-    this.plugin.on("message", async (msg: UnifiedMessage) => {
-      await this.handleIncomingMessage(msg);
+    // EventEmitter does not await listeners, so each message is processed
+    // without blocking the next; failures are logged instead of going unhandled
+    this.plugin.on("message", (msg: UnifiedMessage) => {
+      this.handleIncomingMessage(msg).catch((err: unknown) => {
+        logger.error(
+          "[WhatsApp] Failed to handle incoming message:",
+          err instanceof Error ? err.message : String(err)
+        );
+      });
     });
 
     // Register send handler so the runtime can route replies back to WhatsApp
@@ -123,35 +144,81 @@ export class WhatsAppConnectorService extends Service {
     logger.info("[WhatsApp] Connector service started");
   }
 
-  private async handleIncomingMessage(msg: UnifiedMessage): Promise<void> {
-    const runtime = this.runtime;
-    if (!msg.content || msg.type !== "text") return;
+  /** Ensure the WhatsApp world exists once per cache period rather than per message */
+  private ensureWorld(): Promise<UUID> {
+    const now = Date.now();
+    if (!this.worldReady || this.worldExpiresAt <= now) {
+      const runtime = this.runtime;
+      const worldId = stringToUuid(`whatsapp-world-${runtime.agentId}`);
+      const ready = runtime
+        .ensureWorldExists({
+          id: worldId,
+          agentId: runtime.agentId,
+          name: "WhatsApp",
+          metadata: { source: SOURCE },
+        })
+        .then(() => worldId)
+        .catch((err) => {
+          // Let the next message retry, unless stop() already reset the cache
+          if (this.worldReady === ready) this.worldReady = null;
+          throw err;
+        });
+      this.worldReady = ready;
+      this.worldExpiresAt = now + ENSURE_CACHE_TTL_MS;
+    }
+    return this.worldReady;
+  }
 
-    // Derive consistent UUIDs from WhatsApp JIDs
-    const entityId = stringToUuid(`whatsapp-entity-${msg.from}`);
-    const roomId = stringToUuid(`whatsapp-room-${msg.from}-${runtime.agentId}`);
-    const worldId = stringToUuid(`whatsapp-world-${runtime.agentId}`);
+  /** Ensure entity, room, and participant once per sender rather than per message */
+  private ensureSender(from: string): Promise<SenderIds> {
+    const now = Date.now();
+    const cached = this.senders.get(from);
+    if (cached) {
+      // Re-insert so Map order tracks recency for eviction
+      this.senders.delete(from);
+      if (cached.expiresAt > now) {
+        this.senders.set(from, cached);
+        return cached.pending;
+      }
+    }
 
-    // Ensure the WhatsApp world exists
-    await runtime.ensureWorldExists({
-      id: worldId,
-      agentId: runtime.agentId,
-      name: "WhatsApp",
-      metadata: { source: SOURCE },
+    const runtime = this.runtime;
+    // Derive consistent UUIDs from WhatsApp JIDs
+    const entityId = stringToUuid(`whatsapp-entity-${from}`);
+    const roomId = stringToUuid(`whatsapp-room-${from}-${runtime.agentId}`);
+    const pending = this.ensureWorld().then((worldId) =>
+      runtime
+        .ensureConnection({
+          entityId,
+          roomId,
+          worldId,
+          userName: from,
+          name: from,
+          source: SOURCE,
+          type: ChannelType.DM,
+          channelId: from,
+        })
+        .then(() => ({ entityId, roomId }))
+    );
+    const entry = { expiresAt: now + ENSURE_CACHE_TTL_MS, pending };
+    // Let the next message from this sender retry
+    pending.catch(() => {
+      if (this.senders.get(from) === entry) this.senders.delete(from);
     });
+    this.senders.set(from, entry);
+    if (this.senders.size > SENDER_CACHE_MAX) {
+      this.senders.delete(this.senders.keys().next().value);
+    }
+    return pending;
+  }
 
-    // Ensure entity, room, and participant in one call
-    await runtime.ensureConnection({
-      entityId,
-      roomId,
-      worldId,
-      userName: msg.from,
-      name: msg.from,
-      source: SOURCE,
-      type: ChannelType.DM,
-      channelId: msg.from,
-    });
+  private async handleIncomingMessage(msg: UnifiedMessage): Promise<void> {
+    const runtime = this.runtime;
+    if (!msg.content || msg.type !== "text") return;
+
+    const { entityId, roomId } = await this.ensureSender(msg.from);
 
+    const now = Date.now();
     const memory: Memory = {
       id: stringToUuid(`whatsapp-msg-${msg.id}`),
       agentId: runtime.agentId,
@@ -162,8 +229,8 @@ export class WhatsAppConnectorService extends Service {
         source: SOURCE,
         channelId: msg.from,
       },
-      createdAt: msg.timestamp ? msg.timestamp * 1000 : Date.now(),
-      metadata: { type: "message", timestamp: Date.now(), scope: "private" },
+      createdAt: msg.timestamp ? msg.timestamp * 1000 : now,
+      metadata: { type: "message", timestamp: now, scope: "private" },
     };
 
     await runtime.createMemory(memory, "messages");
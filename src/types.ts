@@ -15,6 +15,15 @@ export interface CloudAPIConfig {
     webhookVerifyToken?: string;
     businessAccountId?: string;
     apiVersion?: string;
+    maxRetries?: number;    // Retries on throttled (429/503) responses (default: 3)
+    // Also retry other 5xx responses. Off by default: sends are not idempotent, and
+    // a 5xx may arrive after the message was accepted, causing duplicate delivery
+    retryServerErrors?: boolean;
+    maxSockets?: number;    // Connection pool size to graph.facebook.com (default: 100)
+    maxFreeSockets?: number; // Idle keep-alive sockets kept open (default: 20)
+    // Issue one GET /{phoneNumberId} on start to open a connection early (default: false).
+    // Counts against rate limits and needs a token that can read the phone number
+    warmUpConnection?: boolean;
 }
 
 export interface WhatsAppMessage {
@@ -23,6 +32,17 @@ export interface WhatsAppMessage {
     content: string | WhatsAppTemplate;
 }
 
+// Narrowed variants; isTextMessage/isTemplateMessage in utils/validators narrow to them
+export interface WhatsAppTextMessage extends WhatsAppMessage {
+    type: "text";
+    content: string;
+}
+
+export interface WhatsAppTemplateMessage extends WhatsAppMessage {
+    type: "template";
+    content: WhatsAppTemplate;
+}
+
 export interface WhatsAppTemplate {
     name: string;
     language: {
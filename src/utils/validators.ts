@@ -1,4 +1,13 @@
-import type { WhatsAppMessage, WhatsAppTemplate, WhatsAppConfig } from "../types";
+import type {
+    WhatsAppMessage,
+    WhatsAppTemplate,
+    WhatsAppTextMessage,
+    WhatsAppTemplateMessage,
+    WhatsAppConfig,
+} from "../types";
+
+// Basic phone number validation - can be enhanced based on requirements
+const PHONE_NUMBER_REGEX = /^\d{1,15}$/;
 
 export function validateConfig(config: WhatsAppConfig): void {
     if (!config.accessToken) {
@@ -22,11 +31,20 @@ export function validateMessage(message: WhatsAppMessage): void {
         throw new Error("Message content is required");
     }
 
-    if (message.type === "template") {
-        validateTemplate(message.content as WhatsAppTemplate);
+    if (isTemplateMessage(message)) {
+        validateTemplate(message.content);
     }
 }
 
+// Narrow a message by its type so content is typed without a cast
+export function isTextMessage(message: WhatsAppMessage): message is WhatsAppTextMessage {
+    return message.type === "text";
+}
+
+export function isTemplateMessage(message: WhatsAppMessage): message is WhatsAppTemplateMessage {
+    return message.type === "template";
+}
+
 export function validateTemplate(template: WhatsAppTemplate): void {
     if (!template.name) {
         throw new Error("Template name is required");
@@ -38,7 +56,5 @@ export function validateTemplate(template: WhatsAppTemplate): void {
 }
 
 export function validatePhoneNumber(phoneNumber: string): boolean {
-    // Basic phone number validation - can be enhanced based on requirements
-    const phoneRegex = /^\d{1,15}$/;
-    return phoneRegex.test(phoneNumber);
+    return PHONE_NUMBER_REGEX.test(phoneNumber);
 }